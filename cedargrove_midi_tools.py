@@ -19,14 +19,38 @@ Implementation Notes
   https://circuitpython.org/downloads
 """
 
-from math import log  # Required for freq_note helper
+from math import frexp, ldexp, log  # Required for freq_note helpers
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/CedarGroveStudios/CircuitPython_MIDI_Tools.git"
 
 
-# Note names used by note_or_name, note_name, and name_note helpers
-NOTE_BASE = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+# Note names used to build the note name tables
+NOTE_BASE = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# Note names for all MIDI note values used by note_or_name and note_to_name helpers
+_NOTE_NAMES = tuple(NOTE_BASE[note % 12] + str((note // 12) - 1) for note in range(128))
+
+# Note values for all note names used by name_to_note helper
+_NAME_TO_NOTE = {name: note for note, name in enumerate(_NOTE_NAMES)}
+
+# Semitone frequency ratios within an octave
+_SEMI = tuple(pow(2, semitone / 12) for semitone in range(12))
+
+# Note frequencies used by note_to_frequency and freq_note helpers; includes
+#   note 128 as the upper frequency limit. Octaves are applied with
+#   ldexp which scales the float exponent rather than calling pow.
+_NOTE_FREQ = tuple(
+    ldexp(440.0 * _SEMI[(note - 69) % 12], (note - 69) // 12) for note in range(129)
+)
+
+# Frequency range limits and scale factors used by note_to_frequency and
+#   freq_note helpers
+_FREQ_MIN = _NOTE_FREQ[0]
+_FREQ_MAX = _NOTE_FREQ[128]
+_INV12 = 1.0 / 12
+_INV_440 = 1.0 / 440
+_CENTS_PER_LN = 1200.0 / log(2)
 
 
 def note_or_name(value):
@@ -40,12 +64,15 @@ def note_or_name(value):
     :param union(int, str) value: The note name or note value input. Note value
     is an integer Note name is a string. No default value.
     """
-    if isinstance(value, str):
+    value_type = type(value)
+    if value_type is int:
+        # Input is an integer, so it's a note value; note_to_name inlined
+        if 0 <= value <= 127:
+            return _NOTE_NAMES[value]
+        return None  # Note value outside valid range
+    if value_type is str:
         # Input is a string, so it's a note name
         return name_to_note(value)
-    if isinstance(value, int):
-        # Input is an integer, so it's a note value
-        return note_to_name(value)
     return None  # Invalid input parameter type
 
 
@@ -60,7 +87,7 @@ def note_to_name(note):
     No default value.
     """
     if 0 <= note <= 127:
-        return NOTE_BASE[note % 12] + str((note // 12) - 1)
+        return _NOTE_NAMES[note]
     return None  # Note value outside valid range
 
 
@@ -74,21 +101,12 @@ def name_to_note(name):
 
     :param str name: The note name input in SPN format. No default value.
     """
-    name = name.upper()  # Convert lower to uppercase
-    if "-" in name:
-        octave = int(name[-2:])
-        name = name[:-2]
-    else:
-        octave = int(name[-1:])
-        name = name[:-1]
-
-    if name in NOTE_BASE:
-        # Note name is valid
-        note = NOTE_BASE.index(name)
-        midi_note = note + (12 * (octave + 1))  # MIDI note value
-        if 0 <= midi_note <= 127:
-            return midi_note
-    return None  # Name is invalid or outside MIDI value range
+    note = _NAME_TO_NOTE.get(name)
+    if note is None:
+        # Retry with the name converted to uppercase; None if the name is
+        #   invalid or outside the MIDI value range
+        note = _NAME_TO_NOTE.get(name.upper())
+    return note
 
 
 def note_to_frequency(note):
@@ -103,10 +121,37 @@ def note_to_frequency(note):
     (inclusive). No default.
     """
     if 0 <= note <= 127:
-        return pow(2, (note - 69) / 12) * 440
+        if type(note) is int:  # pylint: disable=unidiomatic-typecheck
+            return _NOTE_FREQ[note]
+        # Fractional note value such as a pitch-bent note
+        return pow(2, (note - 69) * _INV12) * 440
     return None  # note value outside valid range
 
 
+def _frequency_note(frequency):
+    """Finds the MIDI note value at or below a frequency in Hertz (Hz). The
+    frequency must be at least _FREQ_MIN and less than _FREQ_MAX. Used by the
+    frequency_to_note and frequency_to_note_cents helpers.
+
+    :param float frequency: The frequency value input in Hz. No default.
+    """
+    # Estimate log2(frequency / 440) from the float exponent plus a
+    #   quadratic approximation of log2 over the mantissa (error < 0.06 note)
+    mantissa, exponent = frexp(frequency * _INV_440)
+    mantissa = 2 * mantissa
+    log2_ratio = (
+        exponent - 1 + (-0.34484843 * mantissa + 2.02466578) * mantissa - 1.67487759
+    )
+    note = min(max(int(69 + (12 * log2_ratio)), 0), 127)
+
+    # Correct the estimate against the note frequency table
+    while note < 127 and frequency >= _NOTE_FREQ[note + 1]:
+        note += 1
+    while note > 0 and frequency < _NOTE_FREQ[note]:
+        note -= 1
+    return note
+
+
 def frequency_to_note(frequency):
     """Translates a frequency in Hertz (Hz) to a MIDI sequential note value.
     Frequency values are floating point. Note values are integers in the range
@@ -118,8 +163,8 @@ def frequency_to_note(frequency):
 
     :param float frequency: The frequency value input in Hz. No default.
     """
-    if (pow(2, (0 - 69) / 12) * 440) <= frequency <= (pow(2, (128 - 69) / 12) * 440):
-        return int(69 + (12 * log(frequency / 440, 2)))
+    if _FREQ_MIN <= frequency < _FREQ_MAX:
+        return _frequency_note(frequency)
     return None  # Frequency outside valid range
 
 
@@ -136,16 +181,17 @@ def frequency_to_note_cents(frequency):
 
     :param float frequency: The frequency value input in Hz. No default.
     """
-    if (pow(2, (0 - 69) / 12) * 440) <= frequency <= (pow(2, (128 - 69) / 12) * 440):
-        note = int(69 + (12 * log(frequency / 440, 2)))
-        note_freq = pow(2, (note - 69) / 12) * 440
-        return note, int(1200 * log(frequency / note_freq, 2))
+    if _FREQ_MIN <= frequency < _FREQ_MAX:
+        note = _frequency_note(frequency)
+        note_freq = _NOTE_FREQ[note]
+        return note, int(_CENTS_PER_LN * log(frequency / note_freq))
     return None, None  # Frequency outside valid range
 
 
-# Controller descriptions -- no list offset
+# Controller descriptions -- no list offset; indexed directly by the Control
+#   Change code value, e.g. CONTROLLERS[cc_code] for a validated 0 to 127 code
 #   0-63 continuous, 64-121 switch, 122-127 channel mode
-CONTROLLERS = [
+CONTROLLERS = (
     "Bank_Select",
     "Modulation",
     "Breath_Ctrl",
@@ -274,14 +320,19 @@ CONTROLLERS = [
     "Omni_Mode_On",
     "Mono_Mode_On",
     "Poly_Mode_On",
-]
+)
 
 
 def cc_code_to_description(cc_code):
     """Provides a controller description decoded from a Control Change code value.
+    If the input value is outside the range of 0 to 127, the value of `None` is
+    returned. Callers that already validate the code value can index the
+    `CONTROLLERS` tuple directly to avoid the function call.
     https://www.midi.org/specifications-old/item/table-3-control-change-messages-data-bytes-2
 
     :param int cc_code: The Control Change code value in the range of 0 to 127.
     No default value.
     """
-    return CONTROLLERS[cc_code]
+    if 0 <= cc_code <= 127:
+        return CONTROLLERS[cc_code]
+    return None  # Control Change code value outside valid range
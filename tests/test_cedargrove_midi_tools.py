@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 JG for Cedar Grove Maker Studios
+#
+# SPDX-License-Identifier: MIT
+
+from cedargrove_midi_tools import (
+    cc_code_to_description,
+    frequency_to_note,
+    frequency_to_note_cents,
+    name_to_note,
+    note_or_name,
+    note_to_frequency,
+)
+
+
+def test_note_to_frequency():
+    for note in range(128):
+        frequency = pow(2, (note - 69) / 12) * 440
+        assert abs(note_to_frequency(note) - frequency) < 1e-9 * frequency
+    assert note_to_frequency(-1) is None
+    assert note_to_frequency(128) is None
+
+
+def test_fractional_note_frequency():
+    assert abs(note_to_frequency(69.5) - 452.8929841231365) < 1e-9
+    assert note_to_frequency(127.5) is None
+
+
+def test_name_to_note():
+    assert name_to_note("C4") == 60
+    assert name_to_note("C-1") == 0
+    assert name_to_note("G9") == 127
+    assert name_to_note("a#4") == 70
+    assert name_to_note("G#9") is None
+    assert name_to_note("H4") is None
+    assert name_to_note("C") is None
+    assert name_to_note("") is None
+
+
+def test_frequency_to_note_cents():
+    for note in range(128):
+        frequency = note_to_frequency(note) * pow(2, 25.5 / 1200)
+        assert frequency_to_note_cents(frequency) == (note, 25)
+    assert frequency_to_note_cents(note_to_frequency(0) * 0.99) == (None, None)
+
+
+def test_cc_code_to_description():
+    assert cc_code_to_description(0) == "Bank_Select"
+    assert cc_code_to_description(127) == "Poly_Mode_On"
+    assert cc_code_to_description(-1) is None
+    assert cc_code_to_description(128) is None
+
+
+def test_note_or_name():
+    assert note_or_name(79) == "G5"
+    assert note_or_name("G5") == 79
+    assert note_or_name(128) is None
+    assert note_or_name(True) is None
+    assert note_or_name(60.0) is None
+
+
+def test_note_frequency_round_trip():
+    for note in range(128):
+        frequency = note_to_frequency(note)
+        assert frequency_to_note(frequency) == note
+        assert frequency_to_note_cents(frequency) == (note, 0)
+
+
+def test_frequency_range_limits():
+    top = note_to_frequency(127)
+    assert frequency_to_note(top * 1.059) == 127
+    assert frequency_to_note_cents(top * 1.059)[0] == 127
+    assert frequency_to_note(top * 1.06) is None
+    assert frequency_to_note_cents(top * 1.06) == (None, None)
+    assert frequency_to_note(note_to_frequency(0) * 0.99) is None